@@ -1,10 +1,41 @@
+from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DEBUG: bool = False
+
+    # Number of uvicorn worker processes; unset runs a single worker.
+    # Every worker has its own pool, so WEB_CONCURRENCY *
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) must stay below the server's
+    # max_connections. Enable DB_USE_PGBOUNCER when that doesn't fit.
+    WEB_CONCURRENCY: Optional[int] = None
+
+    # Connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Connections opened at startup (capped at DB_POOL_SIZE); 0 disables
+    DB_POOL_WARMUP: int = 1
+
+    # Compiled SQL statement cache entries kept by the engine
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # Set when DATABASE_URL points at PgBouncer in transaction mode
+    DB_USE_PGBOUNCER: bool = False
 
     model_config = SettingsConfigDict(env_file=".env")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
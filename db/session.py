@@ -1,11 +1,43 @@
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 
 from core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True, future=True)
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer owns the pool. In transaction mode a backend is shared
+    # between clients, so asyncpg's statement caches are disabled and each
+    # prepared statement gets a unique name; asyncpg's default sequential
+    # names would collide with DuplicatePreparedStatementError.
+    engine_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    future=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **engine_options,
+)
 
 SessionLocal = async_sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
-)
\ No newline at end of file
+)
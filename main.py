@@ -1,17 +1,63 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+
+from core.config import settings
+from db import engine
 from routers import AuthRouter
 
 
-app = FastAPI(title="Documents Exp API")
+logger = logging.getLogger(__name__)
+
+
+async def _ping_db() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open a few pool connections up front so the first requests don't pay
+    # for connection setup. Warm-up is best effort: the app still starts
+    # when the database is unreachable, as it did without this hook.
+    warm_connections = min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+    if warm_connections > 0:
+        try:
+            await asyncio.gather(*(_ping_db() for _ in range(warm_connections)))
+        except Exception:
+            logger.warning("Database pool warm-up failed", exc_info=True)
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="Documents Exp API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.include_router(AuthRouter)
 
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host="127.0.0.1",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+    if settings.DEBUG:
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=8000,
+            reload=True
+        )
+    else:
+        # loop/http default to "auto": uvloop and httptools are used
+        # when installed (uvicorn[standard]), asyncio/h11 otherwise.
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=8000,
+            workers=settings.WEB_CONCURRENCY,
+        )
@@ -9,7 +9,7 @@ class User(Base):
     # Evry column names has the same name as in SQL
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, nullable=False)
-    email = Column(String(100))
+    email = Column(String(100), index=True)
     is_active = Column(Boolean, default=True)
 
     password_hash = Column(String, nullable=False)
\ No newline at end of file
@@ -1,3 +1,5 @@
 class AuthRepository:
+    __slots__ = ("db",)
+
     def __init__(self, db):
-        self.db = db
\ No newline at end of file
+        self.db = db
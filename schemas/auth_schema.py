@@ -1,6 +1,23 @@
-from pydantic import BaseModel, EmailStr
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, StringConstraints
+
+
+def _lowercase_domain(email: str) -> str:
+    local, domain = email.rsplit("@", 1)
+    return f"{local}@{domain.lower()}"
+
+
+# Checked by pydantic-core's compiled regex instead of the
+# email-validator package that EmailStr calls into. The domain must be
+# dot-separated non-empty labels, and is lowercased like EmailStr did.
+Email = Annotated[
+    str,
+    StringConstraints(pattern=r"^[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+$"),
+    AfterValidator(_lowercase_domain),
+]
 
 
 class UserLogin(BaseModel):
-    email: EmailStr
-    password: str
\ No newline at end of file
+    email: Email
+    password: str
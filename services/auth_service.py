@@ -4,5 +4,7 @@ from repositories import AuthRepository
 
 
 class AuthService:
+    __slots__ = ("repo",)
+
     def __init__(self, db: AsyncSession):
-        self.repo = AuthRepository(db)
\ No newline at end of file
+        self.repo = AuthRepository(db)